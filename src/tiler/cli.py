@@ -8,15 +8,25 @@ from __future__ import annotations
 import argparse
 import sys
 
-from .storage import LocalTileStore, S3TileStore
+from .storage import LocalTileStore, S3TileStore, s3_client
 from .tiles import tile_image
 
 
-def _progress(written: int, total: int) -> None:
+def _draw_progress(written: int, total: int) -> None:
     pct = 100 * written / total if total else 100
     print(f"\r  tiling… {written}/{total} ({pct:5.1f}%)", end="", flush=True)
 
 
+def _progress(written: int, total: int) -> None:
+    # Called once per tile; repaint only when the shown 0.1% step changes so
+    # large pyramids don't spend their time formatting and flushing stdout.
+    # main() repaints once more at the end, since skipped blank tiles mean
+    # ``written`` may never reach ``total``.
+    if total and 1000 * written // total == 1000 * (written - 1) // total:
+        return
+    _draw_progress(written, total)
+
+
 def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(prog="tiler")
     sub = parser.add_subparsers(dest="cmd", required=True)
@@ -33,12 +43,18 @@ def main(argv: list[str] | None = None) -> int:
     t.add_argument("--min-zoom", type=int, default=0)
     t.add_argument("--max-zoom", type=int, default=None)
     t.add_argument("--keep-blank", action="store_true", help="store fully transparent tiles too")
+    t.add_argument("--workers", type=int, default=None, help="encode/upload threads (default: one per CPU)")
 
     args = parser.parse_args(argv)
 
     if bool(args.out) == bool(args.s3):
         parser.error("provide exactly one of --out or --s3")
-    store = S3TileStore(args.s3) if args.s3 else LocalTileStore(args.out)
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.s3:
+        store = S3TileStore(args.s3, client=s3_client(max_connections=args.workers))
+    else:
+        store = LocalTileStore(args.out)
 
     result = tile_image(
         args.image,
@@ -50,8 +66,10 @@ def main(argv: list[str] | None = None) -> int:
         fmt=args.format,
         quality=args.quality,
         skip_blank=not args.keep_blank,
+        workers=args.workers,
         on_progress=_progress,
     )
+    _draw_progress(result.tiles_written, result.tiles_written + result.tiles_skipped)
     print()  # newline after progress bar
     print(
         f"done: {result.tiles_written} tiles written, {result.tiles_skipped} blank skipped, "
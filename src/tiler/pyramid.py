@@ -101,19 +101,25 @@ def generate_tiles(
         resample: int = Image.LANCZOS,
         skip_blank: bool = True,
 ) -> Iterator[Tile]:
-    """Yield every tile in the pyramid, lazily.
-
-    Partial edge tiles are padded with transparency to a full ``tile_size``
-    square. When ``skip_blank`` is set, fully transparent tiles are dropped so
-    sparse / non-rectangular maps don't waste storage.
+    """Yield every tile in the pyramid, lazily, from ``max_zoom`` down.
+
+    Each level is downsampled from the level above it rather than from the
+    native image, so building the whole pyramid costs about one extra pass
+    over the source instead of one per zoom level. Partial edge tiles are
+    padded with transparency to a full ``tile_size`` square. When
+    ``skip_blank`` is set, fully transparent tiles are dropped so sparse /
+    non-rectangular maps don't waste storage.
     """
-    src = source.convert("RGBA")
+    # convert() copies even when the mode already matches; at native
+    # resolution that's a second full-size bitmap we only ever read from.
+    # Hold it only as the current level so the first resize can release it.
+    level_img = source if source.mode == "RGBA" else source.convert("RGBA")
     ts = spec.tile_size
 
-    for z in spec.zoom_range():
+    for z in reversed(spec.zoom_range()):
         level_w, level_h = spec.level_dimensions(z)
-        scale = 2 ** (spec.max_zoom - z)
-        level_img = src if scale == 1 else src.resize((level_w, level_h), resample)
+        if level_img.size != (level_w, level_h):
+            level_img = level_img.resize((level_w, level_h), resample)
         cols, rows = spec.grid_dimensions(z)
 
         for ty in range(rows):
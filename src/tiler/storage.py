@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import io
 import json
+import os
 from pathlib import Path
 from typing import Protocol
 
@@ -44,7 +45,11 @@ def extension(fmt: str) -> str:
 
 
 class TileStore(Protocol):
-    """Anything that can persist tiles + a per-map manifest."""
+    """Anything that can persist tiles + a per-map manifest.
+
+    ``put_tile`` is called from the tiling thread pool, so it must be safe to
+    call concurrently (both shipped stores are).
+    """
 
     def put_tile(self, key: str, data: bytes, *, mime: str) -> None: ...
     def put_manifest(self, key: str, manifest: dict) -> None: ...
@@ -72,6 +77,23 @@ class LocalTileStore:
         path.write_text(json.dumps(manifest, indent=2))
 
 
+def s3_client(*, max_connections: int | None = None):
+    """A boto3 S3 client whose connection pool fits ``max_connections`` uploads.
+
+    botocore keeps 10 pooled connections by default; tiling more threads than
+    that discards and re-opens connections (a TLS handshake per tile). Only the
+    pool is sized here; retries still follow ``AWS_RETRY_MODE`` /
+    ``AWS_MAX_ATTEMPTS`` / ``~/.aws/config`` like any other boto3 client. As in
+    ``tile_image``, the default counts host CPUs, not a container's CPU limit.
+    """
+    import boto3  # lazy: only needed in production
+    from botocore.config import Config
+
+    if max_connections is None:
+        max_connections = os.cpu_count() or 1
+    return boto3.client("s3", config=Config(max_pool_connections=max(10, max_connections)))
+
+
 class S3TileStore:
     """Write tiles to any S3-compatible bucket (AWS S3, MinIO, R2, ...).
 
@@ -82,9 +104,7 @@ class S3TileStore:
 
     def __init__(self, bucket: str, *, client=None, cache_control: str = "public, max-age=31536000, immutable"):
         if client is None:
-            import boto3  # lazy: only needed in production
-
-            client = boto3.client("s3")
+            client = s3_client()
         self.bucket = bucket
         self.client = client
         self.cache_control = cache_control
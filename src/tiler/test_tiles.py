@@ -0,0 +1,80 @@
+import threading
+import time
+
+import pytest
+from PIL import Image, ImageDraw
+
+from tiles import tile_image
+
+
+class MemoryStore:
+    """In-memory ``TileStore`` that records every call."""
+
+    def __init__(self, fail_key: str | None = None, delay: float = 0.0):
+        self.tiles: dict[str, bytes] = {}
+        self.manifests: dict[str, dict] = {}
+        self.calls = 0
+        self.fail_key = fail_key
+        self.delay = delay
+        self._lock = threading.Lock()
+
+    def put_tile(self, key: str, data: bytes, *, mime: str) -> None:
+        with self._lock:
+            self.calls += 1
+        if key == self.fail_key:
+            raise OSError("store unavailable")
+        time.sleep(self.delay)
+        with self._lock:
+            self.tiles[key] = data
+
+    def put_manifest(self, key: str, manifest: dict) -> None:
+        self.manifests[key] = manifest
+
+
+def _sample_map() -> Image.Image:
+    img = Image.new("RGBA", (1000, 700), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(img)
+    for i in range(12):
+        draw.ellipse((i * 70, i * 40, i * 70 + 150, i * 40 + 110), fill=(20 * i, 90, 255 - 20 * i, 255))
+    return img
+
+
+def test_parallel_output_matches_serial():
+    serial, parallel = MemoryStore(), MemoryStore()
+    tile_image(_sample_map(), serial, "m", fmt="png", workers=1)
+    tile_image(_sample_map(), parallel, "m", fmt="png", workers=4)
+    assert serial.tiles
+    assert parallel.tiles == serial.tiles
+
+
+def test_failed_put_propagates_and_cancels_queued_puts():
+    workers = 4
+    # The first tile cut (max zoom, top-left) fails at once; the rest are slow
+    # enough that the window (2 * workers) is still queued when it surfaces.
+    store = MemoryStore(fail_key="m/2/0/0.png", delay=0.2)
+    source = Image.new("RGBA", (1024, 1024), (1, 2, 3, 255))
+    with pytest.raises(OSError, match="store unavailable"):
+        tile_image(source, store, "m", fmt="png", workers=workers)
+    assert store.manifests == {}
+    # The failed put, the workers - 1 already running, and at most one more
+    # picked up by the freed thread before cancellation; nothing else.
+    assert store.calls <= workers + 1
+
+
+@pytest.mark.parametrize("workers", [0, -1])
+def test_rejects_non_positive_workers(workers):
+    store = MemoryStore()
+    with pytest.raises(ValueError, match="workers"):
+        tile_image(_sample_map(), store, "m", workers=workers)
+    assert store.calls == 0
+
+
+def test_progress_reported_in_order_on_calling_thread():
+    seen = []
+
+    def on_progress(written: int, total: int) -> None:
+        seen.append((written, threading.get_ident()))
+
+    result = tile_image(_sample_map(), MemoryStore(), "m", workers=4, on_progress=on_progress)
+    assert [w for w, _ in seen] == list(range(1, result.tiles_written + 1))
+    assert {ident for _, ident in seen} == {threading.get_ident()}
@@ -1,13 +1,16 @@
 """Orchestration: turn one source image into a stored tile pyramid + manifest."""
 from __future__ import annotations
 
+import os
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, dataclass
 from pathlib import Path
 
 from PIL import Image
 
-from pyramid import TILE_SIZE, generate_tiles, plan_pyramid
+from pyramid import TILE_SIZE, Tile, generate_tiles, plan_pyramid
 from storage import TileStore, content_type, encode_tile, tile_key
 
 
@@ -55,13 +58,23 @@ def tile_image(
         quality: int = 85,
         skip_blank: bool = True,
         write_manifest: bool = True,
+        workers: int | None = None,
         on_progress=None,
 ) -> TileResult:
     """Tile ``source`` into ``store`` under ``prefix`` and return a manifest.
 
     ``prefix`` is the per-map key namespace, e.g. ``"elden-ring/overworld"``.
     ``on_progress`` (optional) is called as ``on_progress(written, total)``.
+
+    Encoding and storing run on a pool of ``workers`` threads (default: one per
+    CPU) while tiles are cut on the calling thread; Pillow's encoders and the
+    store's I/O release the GIL, so they overlap. ``store.put_tile`` must be
+    safe to call from several threads at once. The default uses
+    ``os.cpu_count()``, which reports the host's CPUs rather than a container's
+    CPU limit, so pass ``workers`` explicitly when running under one.
     """
+    if workers is not None and workers < 1:
+        raise ValueError(f"workers must be >= 1, got {workers}")
     img = source if isinstance(source, Image.Image) else Image.open(source)
     spec = plan_pyramid(
         img.width, img.height, tile_size=tile_size, min_zoom=min_zoom, max_zoom=max_zoom
@@ -69,14 +82,38 @@ def tile_image(
     total = spec.tile_count()
     mime = content_type(fmt)
 
-    started = time.monotonic()
-    written = skipped = 0
-    for tile in generate_tiles(img, spec, skip_blank=skip_blank):
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    def put(tile: Tile) -> None:
         data = encode_tile(tile.image, fmt, quality=quality)
         store.put_tile(tile_key(prefix, tile.z, tile.x, tile.y, fmt), data, mime=mime)
+
+    started = time.monotonic()
+    written = skipped = 0
+    # Bound the in-flight window so a fast cutter can't queue the whole
+    # pyramid's decoded tiles in memory ahead of the encoders.
+    pending = deque()
+
+    def settle_oldest() -> None:
+        nonlocal written
+        pending.popleft().result()  # re-raises a failed encode/upload
         written += 1
         if on_progress is not None:
             on_progress(written, total)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        try:
+            for tile in generate_tiles(img, spec, skip_blank=skip_blank):
+                if len(pending) >= 2 * workers:
+                    settle_oldest()
+                pending.append(pool.submit(put, tile))
+            while pending:
+                settle_oldest()
+        except BaseException:
+            # The map has failed; don't keep writing tiles under its prefix.
+            pool.shutdown(cancel_futures=True)
+            raise
     skipped = total - written
 
     result = TileResult(
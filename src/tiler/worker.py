@@ -27,7 +27,7 @@ from dataclasses import dataclass
 from PIL import Image
 
 from ritchermap.tiling.v1 import tiling_pb2 as pb
-from storage import S3TileStore
+from storage import S3TileStore, s3_client
 from tiles import tile_image
 
 log = logging.getLogger("tiler.worker")
@@ -49,6 +49,15 @@ class WorkerConfig:
     sasl_mechanism: str | None = None
     sasl_username: str | None = None
     sasl_password: str | None = None
+    # Encode/upload threads per map; None means one per *host* CPU, which
+    # ignores container CPU limits — set TILING_WORKERS in deployments.
+    workers: int | None = None
+
+    def __post_init__(self):
+        # Fail at startup: tile_image() would otherwise reject every job and
+        # each map would be dead-lettered instead.
+        if self.workers is not None and self.workers < 1:
+            raise ValueError(f"workers must be >= 1, got {self.workers}")
 
 
 def _kafka_security_kwargs(cfg: WorkerConfig) -> dict:
@@ -84,6 +93,7 @@ def handle_event(
         req.prefix,
         fmt=req.format or "webp",
         max_zoom=req.max_zoom if req.HasField("max_zoom") else None,
+        workers=cfg.workers,
     )
     return pb.TilingCompleted(
         map_id=req.map_id,  # int64 — keep it an int
@@ -98,10 +108,9 @@ def handle_event(
 
 
 def run(cfg: WorkerConfig) -> None:  # pragma: no cover - requires a live broker
-    import boto3
     from kafka import KafkaConsumer, KafkaProducer
 
-    s3 = boto3.client("s3")
+    s3 = s3_client(max_connections=cfg.workers)
     store = S3TileStore(cfg.output_bucket, client=s3)
     security = _kafka_security_kwargs(cfg)
     consumer = KafkaConsumer(
@@ -137,6 +146,19 @@ def run(cfg: WorkerConfig) -> None:  # pragma: no cover - requires a live broker
             consumer.commit()  # don't reprocess a poison message; dead-letter instead
 
 
+def _workers_from_env() -> int | None:
+    raw = os.environ.get("TILING_WORKERS")
+    if not raw:
+        return None
+    try:
+        workers = int(raw)
+    except ValueError:
+        workers = 0
+    if workers < 1:
+        raise SystemExit(f"TILING_WORKERS must be an integer >= 1, got {raw!r}")
+    return workers
+
+
 def main() -> None:  # pragma: no cover
     logging.basicConfig(level=logging.INFO)
     run(
@@ -149,6 +171,7 @@ def main() -> None:  # pragma: no cover
             sasl_mechanism=os.environ.get("KAFKA_SASL_MECHANISM", "SCRAM-SHA-256"),
             sasl_username=os.environ.get("KAFKA_SASL_USERNAME"),
             sasl_password=os.environ.get("KAFKA_SASL_PASSWORD"),
+            workers=_workers_from_env(),
         )
     )
 